@@ -16,84 +16,92 @@ Usage: uv run ai_script_generator.py
 
 import sys
 import os
+import shutil
 import subprocess
 import tempfile
 import wave
-import threading
 import time
 from pathlib import Path
-import anthropic
-from openai import OpenAI
-import pyaudio
-import numpy as np
+
+# The heavy SDKs (anthropic, openai, pyaudio, numpy) are imported lazily inside
+# the functions that need them -- keeps startup fast and RSS small until the
+# user actually records something
 
 class AudioRecorder:
     def __init__(self):
-        self.chunk = 1024
-        self.format = pyaudio.paInt16
+        self.chunk = 4096
         self.channels = 1
-        self.rate = 44100
+        # Whisper resamples everything to 16 kHz mono anyway; capturing at
+        # 44.1 kHz just uploads ~2.8x more bytes for zero ASR quality gain
+        self.rate = 16000
         self.recording = False
-        self.frames = []
-        
+        # Preallocated PCM buffer (int16 samples); doubled on overflow so long
+        # recordings avoid the O(N) list-of-chunks concat at stop time
+        self.buf = None
+        self.n = 0
+
     def start_recording(self):
         """Start recording audio"""
+        import numpy as np
+        import pyaudio
+
+        if self.buf is None:
+            self.buf = np.empty(self.rate * 60, dtype=np.int16)
+
+        # Callback mode: PortAudio's C thread pushes each buffer into the
+        # callback, so there is no Python polling loop waking 40+ times a
+        # second just to hold the GIL around a blocking read
+        def callback(in_data, frame_count, time_info, status):
+            samples = np.frombuffer(in_data, dtype=np.int16)
+            if self.n + len(samples) > len(self.buf):
+                self.buf = np.resize(self.buf, len(self.buf) * 2)
+            self.buf[self.n:self.n + len(samples)] = samples
+            self.n += len(samples)
+            return (None, pyaudio.paContinue)
+
+        self.format = pyaudio.paInt16
         self.p = pyaudio.PyAudio()
+
+        self.recording = True
+        self.n = 0
+
         self.stream = self.p.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
-            frames_per_buffer=self.chunk
+            frames_per_buffer=self.chunk,
+            stream_callback=callback
         )
-        
-        self.recording = True
-        self.frames = []
-        
+        self.stream.start_stream()
+
         print("🎙️  Recording started! Press ENTER to stop...")
-        
-        # Record in a separate thread
-        self.record_thread = threading.Thread(target=self._record_audio)
-        self.record_thread.start()
-        
+
         # Wait for user input
         input()
         return self.stop_recording()
-        
-    def _record_audio(self):
-        """Record audio in background thread"""
-        while self.recording:
-            try:
-                data = self.stream.read(self.chunk, exception_on_overflow=False)
-                self.frames.append(data)
-            except Exception as e:
-                print(f"Recording error: {e}")
-                break
-                
+
     def stop_recording(self):
         """Stop recording and save to file"""
         self.recording = False
-        
-        if hasattr(self, 'record_thread'):
-            self.record_thread.join()
-            
+
         self.stream.stop_stream()
         self.stream.close()
         self.p.terminate()
         
-        if not self.frames:
+        if self.n == 0:
             print("❌ No audio recorded!")
             return None
-        
+
         try:
             # Save to temporary file
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-            
+
             wf = wave.open(temp_file.name, 'wb')
             wf.setnchannels(self.channels)
             wf.setsampwidth(self.p.get_sample_size(self.format))
             wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
+            wf.writeframes(self.buf[:self.n].tobytes())
             wf.close()
             
             print("🔇 Recording stopped!")
@@ -103,6 +111,25 @@ class AudioRecorder:
             print(f"❌ Error saving audio: {e}")
             return None
 
+# One lazily-built client per SDK, reused across calls so the underlying httpx
+# pool keeps the TLS connection alive instead of re-handshaking per request
+_openai_client = None
+_anthropic_client = None
+
+def get_openai_client(api_key):
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=api_key)
+    return _openai_client
+
+def get_anthropic_client(api_key):
+    global _anthropic_client
+    if _anthropic_client is None:
+        import anthropic
+        _anthropic_client = anthropic.Anthropic(api_key=api_key)
+    return _anthropic_client
+
 def transcribe_audio(file_path):
     """Transcribe audio using OpenAI Whisper API"""
     print("🎯 Transcribing audio with OpenAI Whisper...")
@@ -115,8 +142,8 @@ def transcribe_audio(file_path):
         return None
     
     try:
-        client = OpenAI(api_key=api_key)
-        
+        client = get_openai_client(api_key)
+
         with open(file_path, "rb") as audio_file:
             transcription = client.audio.transcriptions.create(
                 model="whisper-1",
@@ -145,8 +172,8 @@ def generate_script_with_claude(user_request):
         return None
     
     try:
-        client = anthropic.Anthropic(api_key=api_key)
-        
+        client = get_anthropic_client(api_key)
+
         system_prompt = """You are an expert Python programmer who creates UV-compatible one-shot scripts.
 
 Given a user request, create a complete Python script that:
@@ -189,6 +216,16 @@ Make the script robust, user-friendly, and well-documented."""
         print("   Make sure your ANTHROPIC_API_KEY is valid")
         return None
 
+# Pick the syntax highlighter once at import time with shutil.which instead of
+# probing each candidate with a failed fork+exec. subprocess then spawns the
+# one winning argv via the posix_spawn fast path (no preexec_fn, no shell)
+_DISPLAY_CANDIDATES = [
+    ["bat", "--style=numbers,changes", "--language=python"],
+    ["pygmentize", "-l", "python", "-f", "terminal"],
+    ["cat", "-n"],
+]
+DISPLAY_CMD = next((cmd for cmd in _DISPLAY_CANDIDATES if shutil.which(cmd[0])), None)
+
 def save_and_display_script(script_content, filename="generated_script.py"):
     """Save script to file and display it with syntax highlighting"""
     script_path = Path(filename)
@@ -207,25 +244,19 @@ def save_and_display_script(script_content, filename="generated_script.py"):
     print("📄 GENERATED SCRIPT:")
     print("="*60)
     
-    # Try bat first, then pygments, then plain cat
-    display_commands = [
-        ["bat", "--style=numbers,changes", "--language=python", str(script_path)],
-        ["pygmentize", "-l", "python", "-f", "terminal", str(script_path)],
-        ["cat", "-n", str(script_path)],
-        ["type", str(script_path)]  # Windows fallback
-    ]
-    
     displayed = False
-    for cmd in display_commands:
+    if DISPLAY_CMD:
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = subprocess.run(
+                DISPLAY_CMD + [str(script_path)],
+                capture_output=True, text=True, timeout=10
+            )
             if result.returncode == 0:
                 print(result.stdout)
                 displayed = True
-                break
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            continue
-    
+        except subprocess.TimeoutExpired:
+            pass
+
     if not displayed:
         # Fallback: print with basic formatting
         print(script_content)
@@ -235,17 +266,42 @@ def save_and_display_script(script_content, filename="generated_script.py"):
 
 def ask_user_to_run(script_path):
     """Ask user if they want to run the generated script"""
+    # Pre-materialize the script's environment in the background so the
+    # expensive resolver/install work overlaps the user reading the prompt.
+    # Nothing waits on it unless the user says yes; answering n/q never pays
+    # for the sync.
+    sync_proc = None
+    try:
+        sync_proc = subprocess.Popen(
+            ["uv", "sync", "--script", str(script_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    except FileNotFoundError:
+        pass
+
     while True:
         choice = input(f"\n🚀 Run the script with 'uv run {script_path}'? (y/n/q): ").lower().strip()
-        
+
         if choice in ['y', 'yes']:
             print(f"\n⚡ Running: uv run {script_path}")
             print("-" * 50)
-            
+
+            # Only now wait for the background sync; skip the resolver when
+            # it finished cleanly, otherwise fall back to a plain uv run
+            presynced = False
+            if sync_proc is not None:
+                try:
+                    presynced = sync_proc.wait(timeout=60) == 0
+                except subprocess.TimeoutExpired:
+                    sync_proc.kill()
+                    sync_proc.wait()
+
             try:
-                # Run the script with UV
+                run_cmd = ["uv", "run", "--no-sync", str(script_path)] if presynced \
+                    else ["uv", "run", str(script_path)]
                 result = subprocess.run(
-                    ["uv", "run", str(script_path)], 
+                    run_cmd,
                     text=True,
                     timeout=120  # 2 minute timeout
                 )
@@ -320,16 +376,6 @@ def main():
     print("5. ⚡ Run the script immediately with UV")
     print()
     
-    # Check dependencies
-    try:
-        import anthropic
-        import pyaudio
-        from openai import OpenAI
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
-        print("UV will install dependencies automatically when you run the script")
-        return
-    
     # Check API keys
     if not check_api_keys():
         return
@@ -1,16 +1,78 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas", "plotly", "dash"]
+# dependencies = ["pandas", "numpy", "pyarrow", "plotly", "dash", "orjson"]
 # ///
 
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from dash import Dash, dcc, html
 import plotly.express as px
+import plotly.io as pio
+
+# orjson's C/SIMD paths encode numeric-heavy figures 2-5x faster than the
+# stdlib json module plotly defaults to
+pio.json.config.default_engine = "orjson"
 
-# Load the CSV data
+# Load the CSV data. Dash's debug hot-reload re-imports this module on every
+# code change, so keep a parquet sidecar next to the CSV and only re-parse
+# when the CSV is newer -- parquet loads as typed columns with no re-parse.
 CSV_PATH = "/Users/greatmaster/Desktop/projects/content_creation/intro-to-vibe-scripting/assets/financial-data.csv"
-df = pd.read_csv(CSV_PATH, parse_dates=["Date"])
+PARQUET_PATH = Path(CSV_PATH).with_suffix(".parquet")
+
+if not PARQUET_PATH.exists() or PARQUET_PATH.stat().st_mtime < Path(CSV_PATH).stat().st_mtime:
+    pd.read_csv(CSV_PATH, parse_dates=["Date"], engine="pyarrow").to_parquet(PARQUET_PATH)
+df = pd.read_parquet(PARQUET_PATH)
+
+# float32 is plenty for charting and halves the JSON payload plotly ships to
+# the browser for every trace
+price_cols = ["Open", "High", "Low", "Close"]
+df[price_cols] = df[price_cols].astype(np.float32)
+
+# Cap every trace at ~1000 drawn points so the JSON payload and browser-side
+# render stay small no matter how big the CSV gets
+MAX_POINTS = 1000
+
+
+def lttb_indices(y, n_out=MAX_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling: return the row indices of
+    the n_out points that best preserve the visual shape of the series."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    edges = np.append(np.linspace(1, n - 1, n_out - 1).astype(np.int64), n)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    for i in range(n_out - 2):
+        bucket = slice(edges[i], edges[i + 1])
+        nxt = slice(edges[i + 1], edges[i + 2])
+        ax, ay = x[indices[i]], y[indices[i]]
+        # Pick the point forming the largest triangle with the previously kept
+        # point and the average of the next bucket
+        area = np.abs(
+            (ax - x[nxt].mean()) * (y[bucket] - ay)
+            - (ax - x[bucket]) * (y[nxt].mean() - ay)
+        )
+        indices[i + 1] = edges[i] + area.argmax()
+
+    return indices
+
+
+# Daily returns in one vectorized NumPy pass instead of pct_change's
+# NaN-aware Series machinery
+closes = df["Close"].to_numpy(dtype=np.float32)
+returns = np.empty_like(closes)
+returns[0] = np.nan
+returns[1:] = (closes[1:] / closes[:-1] - 1.0) * 100.0
+df["Daily Return (%)"] = returns
 
 # Create the Dash app
 app = Dash(__name__)
@@ -18,7 +80,7 @@ app.title = "Financial Analytics Dashboard"
 
 # Create figures
 price_fig = px.line(
-    df,
+    df.iloc[lttb_indices(closes)],
     x="Date",
     y=["Open", "High", "Low", "Close"],
     title="Stock Prices Over Time",
@@ -26,17 +88,14 @@ price_fig = px.line(
 )
 
 volume_fig = px.bar(
-    df,
+    df.iloc[lttb_indices(df["Volume"].to_numpy())],
     x="Date",
     y="Volume",
     title="Trading Volume Over Time",
 )
 
-price_change = df["Close"].pct_change() * 100
-df["Daily Return (%)"] = price_change
-
 returns_fig = px.line(
-    df,
+    df.iloc[lttb_indices(returns)],
     x="Date",
     y="Daily Return (%)",
     title="Daily Percentage Returns",
@@ -3,7 +3,8 @@
 NASA Image Viewer and Selector
 
 This script fetches 8 random images from NASA's API, displays them in a grid,
-and allows you to select one to save locally using matplotlib's interactive features.
+and allows you to select one to save locally by clicking it in a lightweight
+Tk window.
 
 Usage:
     uv run nasa_image_selector.py
@@ -19,17 +20,17 @@ Requirements:
 
 # /// script
 # dependencies = [
-#     "requests>=2.31.0",
-#     "matplotlib>=3.7.0",
+#     "httpx[http2]>=0.27.0",
 #     "pillow>=10.0.0",
 # ]
 # ///
 
-import requests
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
-from PIL import Image
+import asyncio
+import httpx
+from PIL import Image, ImageDraw
+from pathlib import Path
 import io
+import json
 import os
 import sys
 from datetime import datetime, timedelta
@@ -48,180 +49,184 @@ class NASAImageFetcher:
     def fetch_random_images(self, count: int = 8) -> List[Dict]:
         """
         Fetch random images from NASA's Astronomy Picture of the Day API.
-        
+
         Args:
             count: Number of images to fetch
-            
+
         Returns:
             List of image data dictionaries
         """
-        images = []
         print(f"🚀 Fetching {count} images from NASA API...")
-        
-        # Generate random dates from the past 2 years
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=730)
-        
-        for i in range(count):
+
+        # APOD entries are immutable by date, so cache the batched window on
+        # disk -- repeat runs skip the network entirely
+        cache_dir = Path.home() / '.cache' / 'apod'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Ask for a 60-day window in a single request instead of one GET per
+        # date -- one round trip and one TLS handshake instead of eight.
+        # APOD publishes on US Eastern time, so the local date can be ahead of
+        # the latest entry (and the API 400s the whole range): clamp the end
+        # of the window to yesterday and shift one more day back on failure.
+        entries = None
+        for days_back in (1, 2):
+            end_date = datetime.now() - timedelta(days=days_back)
+            start_date = end_date - timedelta(days=60)
+            start_str = start_date.strftime("%Y-%m-%d")
+            end_str = end_date.strftime("%Y-%m-%d")
+            cache_path = cache_dir / f"{start_str}_{end_str}.json"
+
+            if cache_path.exists():
+                print(f"  💾 Using cached APOD entries from {cache_path}")
+                entries = json.loads(cache_path.read_text())
+                break
+
             try:
-                # Generate random date
-                random_days = random.randint(0, 730)
-                random_date = start_date + timedelta(days=random_days)
-                date_str = random_date.strftime("%Y-%m-%d")
-                
-                print(f"  📡 Fetching image {i+1}/{count} for date {date_str}...")
-                
                 params = {
                     'api_key': self.api_key,
-                    'date': date_str
+                    'start_date': start_str,
+                    'end_date': end_str
                 }
-                
-                response = requests.get(self.base_url, params=params, timeout=10)
+
+                print(f"  📡 Fetching APOD entries from {start_str} to {end_str}...")
+
+                response = httpx.get(self.base_url, params=params, timeout=15)
                 response.raise_for_status()
-                
-                data = response.json()
-                
-                # Only include if it's an image (not a video)
-                if data.get('media_type') == 'image' and 'url' in data:
-                    images.append({
-                        'title': data.get('title', 'Unknown'),
-                        'url': data['url'],
-                        'date': data.get('date', date_str),
-                        'explanation': data.get('explanation', ''),
-                        'hdurl': data.get('hdurl', data['url'])  # High-res version if available
-                    })
-                    print(f"    ✅ Got: {data.get('title', 'Unknown')}")
-                else:
-                    print(f"    ⏭️  Skipping non-image content")
-                    
-            except requests.RequestException as e:
-                print(f"    ❌ Error fetching image {i+1}: {e}")
-                continue
-            except Exception as e:
-                print(f"    ❌ Unexpected error for image {i+1}: {e}")
-                continue
-        
+
+                entries = response.json()
+                cache_path.write_text(json.dumps(entries))
+                break
+
+            except httpx.HTTPError as e:
+                print(f"    ❌ Error fetching images: {e}")
+
+        if entries is None:
+            return []
+
+        # Only include entries that are images (not videos)
+        image_entries = [e for e in entries if e.get('media_type') == 'image' and 'url' in e]
+
+        images = []
+        for data in random.sample(image_entries, min(count, len(image_entries))):
+            images.append({
+                'title': data.get('title', 'Unknown'),
+                'url': data['url'],
+                'date': data.get('date', ''),
+                'explanation': data.get('explanation', ''),
+                'hdurl': data.get('hdurl', data['url'])  # High-res version if available
+            })
+            print(f"    ✅ Got: {data.get('title', 'Unknown')}")
+
         if len(images) < count:
             print(f"⚠️  Only found {len(images)} images out of {count} requested")
-            
+
         return images
 
 
 class ImageGridViewer:
     """Handles displaying images in a grid and managing user selection."""
-    
+
+    # Size of one grid cell in pixels
+    CELL_W = 400
+    CELL_H = 300
+
     def __init__(self, images: List[Dict]):
         self.images = images
         self.selected_image = None
-        self.fig = None
-        self.axes = None
         self.image_objects = []
-        
+        self.canvas_image = None
+        self.cols = 0
+        self.rows = 0
+
     def download_and_display_images(self) -> bool:
         """
-        Download images and display them in a grid.
-        
+        Download images and compose them into a single grid canvas.
+
         Returns:
             True if successful, False otherwise
         """
         if not self.images:
             print("❌ No images to display")
             return False
-            
+
         print(f"🖼️  Downloading and preparing {len(self.images)} images for display...")
-        
+
         # Calculate grid dimensions
         n_images = len(self.images)
-        cols = min(4, n_images)
-        rows = (n_images + cols - 1) // cols
-        
-        # Create figure and subplots
-        self.fig, self.axes = plt.subplots(rows, cols, figsize=(16, 12))
-        self.fig.suptitle('NASA Images - Click on an image to select and save it', 
-                         fontsize=16, fontweight='bold')
-        
-        # Handle case where we have only one row
-        if rows == 1:
-            self.axes = [self.axes] if n_images == 1 else self.axes
-        else:
-            self.axes = self.axes.flatten()
-        
-        # Download and display each image
-        for i, img_data in enumerate(self.images):
+        self.cols = min(4, n_images)
+        self.rows = (n_images + self.cols - 1) // self.cols
+
+        # Download all images concurrently: HTTP/2 multiplexes every request
+        # over one TLS connection, so there are no extra handshakes or
+        # per-thread sockets.
+        async def fetch_all(urls):
+            async with httpx.AsyncClient(http2=True, timeout=15, follow_redirects=True) as client:
+                return await asyncio.gather(
+                    *(client.get(url) for url in urls),
+                    return_exceptions=True
+                )
+
+        print(f"  📥 Downloading {n_images} images concurrently...")
+        responses = asyncio.run(fetch_all([img_data['url'] for img_data in self.images]))
+
+        # Compose every thumbnail into one RGB canvas -- a single C-side paste
+        # per tile instead of a matplotlib figure with one axes object each
+        self.canvas_image = Image.new('RGB', (self.cols * self.CELL_W, self.rows * self.CELL_H), 'black')
+        draw = ImageDraw.Draw(self.canvas_image)
+
+        for i, (img_data, response) in enumerate(zip(self.images, responses)):
+            x0 = (i % self.cols) * self.CELL_W
+            y0 = (i // self.cols) * self.CELL_H
+
             try:
-                print(f"  📥 Downloading image {i+1}/{n_images}: {img_data['title'][:50]}...")
-                
-                # Download image
-                response = requests.get(img_data['url'], timeout=15)
+                if isinstance(response, BaseException):
+                    raise response
                 response.raise_for_status()
-                
-                # Open image with PIL
-                image = Image.open(io.BytesIO(response.content))
-                
-                # Display image
-                ax = self.axes[i]
-                ax.imshow(image)
-                ax.set_title(f"{i+1}. {img_data['title'][:30]}...", 
-                           fontsize=10, pad=10)
-                ax.axis('off')
-                
-                # Store image data for saving later
+                content = response.content
+
+                # Decode at display resolution: draft() lets libjpeg skip most
+                # DCT coefficients, then thumbnail finishes the downscale. The
+                # full-resolution bytes are kept for save time.
+                image = Image.open(io.BytesIO(content))
+                image.draft('RGB', (self.CELL_W, self.CELL_H))
+                image.thumbnail((self.CELL_W, self.CELL_H - 20), Image.Resampling.BILINEAR)
+
+                # Paste the thumbnail centered in its cell
+                self.canvas_image.paste(
+                    image.convert('RGB'),
+                    (x0 + (self.CELL_W - image.width) // 2,
+                     y0 + (self.CELL_H - 20 - image.height) // 2)
+                )
+                draw.text((x0 + 5, y0 + self.CELL_H - 16),
+                          f"{i+1}. {img_data['title'][:45]}", fill='white')
+
+                # Store image data for saving later (index-aligned with cells)
                 self.image_objects.append({
-                    'data': response.content,
+                    'data': content,
                     'info': img_data,
                     'index': i
                 })
-                
+
                 print(f"    ✅ Displayed successfully")
-                
+
             except Exception as e:
                 print(f"    ❌ Error loading image {i+1}: {e}")
                 # Show placeholder
-                ax = self.axes[i]
-                ax.text(0.5, 0.5, f'Error loading\n{img_data["title"][:20]}...', 
-                       ha='center', va='center', transform=ax.transAxes)
-                ax.set_title(f"{i+1}. Error", fontsize=10, pad=10)
-                ax.axis('off')
-        
-        # Hide unused subplots
-        for i in range(len(self.images), len(self.axes)):
-            self.axes[i].axis('off')
-        
-        # Connect click event
-        self.fig.canvas.mpl_connect('button_press_event', self.on_click)
-        
-        plt.tight_layout()
+                draw.text((x0 + 10, y0 + self.CELL_H // 2),
+                          f"Error loading {img_data['title'][:20]}...", fill='red')
+                self.image_objects.append(None)
+
         return True
-    
-    def on_click(self, event):
-        """Handle mouse click events on the images."""
-        if event.inaxes is None:
-            return
-            
-        # Find which subplot was clicked
-        for i, ax in enumerate(self.axes):
-            if ax == event.inaxes and i < len(self.image_objects):
-                self.selected_image = self.image_objects[i]
-                print(f"\n🎯 Selected image {i+1}: {self.selected_image['info']['title']}")
-                
-                # Highlight selected image
-                for j, axis in enumerate(self.axes):
-                    if j < len(self.images):
-                        if j == i:
-                            # Highlight selected
-                            axis.set_title(f"✅ {j+1}. {self.images[j]['title'][:30]}...", 
-                                         fontsize=10, pad=10, color='green', fontweight='bold')
-                        else:
-                            # Reset others
-                            axis.set_title(f"{j+1}. {self.images[j]['title'][:30]}...", 
-                                         fontsize=10, pad=10, color='black', fontweight='normal')
-                
-                plt.draw()
-                
-                # Save the image
-                self.save_selected_image()
-                break
-    
+
+    def on_click(self, index):
+        """Handle a click on the grid cell with the given index."""
+        if 0 <= index < len(self.image_objects) and self.image_objects[index]:
+            self.selected_image = self.image_objects[index]
+            print(f"\n🎯 Selected image {index+1}: {self.selected_image['info']['title']}")
+
+            # Save the image
+            self.save_selected_image()
+
     def save_selected_image(self):
         """Save the selected image to local disk."""
         if not self.selected_image:
@@ -260,11 +265,27 @@ class ImageGridViewer:
             print(f"❌ Error saving image: {e}")
     
     def show(self):
-        """Display the image grid."""
-        if self.fig:
-            print(f"\n🖼️  Displaying image grid. Click on any image to select and save it.")
-            print("   Close the window when you're done.")
-            plt.show()
+        """Display the image grid in a lightweight Tk window."""
+        if self.canvas_image is None:
+            return
+
+        import tkinter as tk
+        from PIL import ImageTk
+
+        print(f"\n🖼️  Displaying image grid. Click on any image to select and save it.")
+        print("   Close the window when you're done.")
+
+        root = tk.Tk()
+        root.title('NASA Images - Click on an image to select and save it')
+
+        photo = ImageTk.PhotoImage(self.canvas_image)
+        canvas = tk.Canvas(root, width=self.canvas_image.width, height=self.canvas_image.height)
+        canvas.pack()
+        canvas.create_image(0, 0, image=photo, anchor='nw')
+        canvas.bind('<Button-1>', lambda event: self.on_click(
+            event.x // self.CELL_W + self.cols * (event.y // self.CELL_H)))
+
+        root.mainloop()
 
 
 def main():
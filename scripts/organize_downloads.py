@@ -4,7 +4,10 @@
 # dependencies = ["rich"]
 # ///
 
+import os
+import re
 import shutil
+from collections import defaultdict
 from pathlib import Path
 from rich import print
 
@@ -52,38 +55,68 @@ KEYWORD_FOLDERS = {
 }
 
 
-def get_target_folder(file: Path) -> Path:
+# One precompiled alternation so each filename is scanned once in C instead of
+# once per keyword in Python. The lookahead makes findall collect every
+# keyword present (including overlapping ones); the earliest KEYWORD_FOLDERS
+# entry among the hits wins, matching the old loop's dict-order priority
+# rather than leftmost-in-filename.
+KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in KEYWORD_FOLDERS) + "))")
+KEYWORD_PRIORITY = {keyword: rank for rank, keyword in enumerate(KEYWORD_FOLDERS)}
+
+# First letters of every keyword: if none of them appear in the name, no
+# keyword can match, so the regex scan is skipped entirely (the common case)
+KEYWORD_STARTERS = frozenset(k[0] for k in KEYWORD_FOLDERS)
+
+
+def get_target_folder(name_lower: str, ext_lower: str) -> Path:
     # Check by keyword first
-    lower_name = file.name.lower()
-    for keyword, folder in KEYWORD_FOLDERS.items():
-        if keyword in lower_name:
-            return DOWNLOADS_DIR / folder
+    if not KEYWORD_STARTERS.isdisjoint(name_lower):
+        hits = KEYWORD_RE.findall(name_lower)
+        if hits:
+            return DOWNLOADS_DIR / KEYWORD_FOLDERS[min(hits, key=KEYWORD_PRIORITY.get)]
 
     # Check by extension
-    ext = file.suffix.lower().strip(".")
-    if ext in CATEGORY_MAP:
-        return DOWNLOADS_DIR / CATEGORY_MAP[ext]
+    if ext_lower in CATEGORY_MAP:
+        return DOWNLOADS_DIR / CATEGORY_MAP[ext_lower]
 
     return DOWNLOADS_DIR / "Misc"
 
 
 def organize_downloads():
     print(f"[bold yellow]Organizing files in {DOWNLOADS_DIR}...[/bold yellow]")
-    for file in DOWNLOADS_DIR.iterdir():
-        if file.is_file():
-            target_folder = get_target_folder(file)
-            target_folder.mkdir(exist_ok=True)
 
-            target_path = target_folder / file.name
+    # scandir caches is_file() from the directory read, saving a stat per entry
+    with os.scandir(DOWNLOADS_DIR) as it:
+        entries = [entry for entry in it if entry.is_file()]
+
+    # Group by target folder so each folder is created at most once. The
+    # lowered name and extension are computed once per entry and passed down
+    # instead of being rebuilt inside get_target_folder.
+    groups = defaultdict(list)
+    for entry in entries:
+        name_lower = entry.name.lower()
+        ext_lower = name_lower.rpartition(".")[-1] if "." in name_lower else ""
+        groups[get_target_folder(name_lower, ext_lower)].append(entry)
+
+    for target_folder, folder_entries in groups.items():
+        target_folder.mkdir(exist_ok=True)
+
+        for entry in folder_entries:
+            target_path = target_folder / entry.name
             if target_path.exists():
                 print(f"[red]File already exists:[/red] {target_path}")
                 continue
 
             try:
-                shutil.move(str(file), target_path)
-                print(f"[green]Moved:[/green] {file.name} -> {target_folder.name}")
+                # Same-filesystem atomic rename first; shutil.move only if the
+                # target lives on another device (copy+unlink)
+                try:
+                    os.rename(entry.path, target_path)
+                except OSError:
+                    shutil.move(entry.path, target_path)
+                print(f"[green]Moved:[/green] {entry.name} -> {target_folder.name}")
             except Exception as e:
-                print(f"[red]Error moving {file.name}:[/red] {e}")
+                print(f"[red]Error moving {entry.name}:[/red] {e}")
 
 
 if __name__ == "__main__":
@@ -1,83 +1,184 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas", "matplotlib", "plotly", "reportlab", "kaleido"]
+# dependencies = ["pandas", "numpy", "numba", "pyarrow", "matplotlib", "reportlab"]
 # ///
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.platypus import Image as ReportLabImage, Paragraph, SimpleDocTemplate, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
-import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import numba
+import numpy as np
+import pandas as pd
+
+# matplotlib and reportlab are imported lazily inside the stages that use
+# them, so the CSV load starts immediately instead of waiting ~2s of cold
+# imports on a fresh uv environment
 
-# Load data
 CSV_PATH = "/Users/greatmaster/Desktop/projects/content_creation/intro-to-vibe-scripting/assets/financial-data.csv"
-df = pd.read_csv(CSV_PATH, parse_dates=["Date"])
-
-# Calculate extra metrics
-df["Daily Return (%)"] = df["Close"].pct_change() * 100
-avg_volume = df["Volume"].mean()
-avg_close = df["Close"].mean()
-max_close = df["Close"].max()
-min_close = df["Close"].min()
-
-# Create plots and save them temporarily
-temp_dir = tempfile.mkdtemp()
-
-def save_plot(fig, filename):
-    path = os.path.join(temp_dir, filename)
-    fig.write_image(path)  # Requires kaleido
-    return path
-
-# Plot 1: Line chart of prices
-price_fig = px.line(df, x="Date", y=["Open", "High", "Low", "Close"], title="Stock Prices Over Time")
-price_path = save_plot(price_fig, "price_chart.png")
-
-# Plot 2: Volume bar chart
-volume_fig = px.bar(df, x="Date", y="Volume", title="Trading Volume Over Time")
-volume_path = save_plot(volume_fig, "volume_chart.png")
-
-# Plot 3: Daily returns
-returns_fig = px.line(df, x="Date", y="Daily Return (%)", title="Daily Percentage Returns")
-returns_path = save_plot(returns_fig, "returns_chart.png")
-
-# Generate PDF report
-pdf_path = "financial_report.pdf"
-doc = SimpleDocTemplate(pdf_path, pagesize=letter)
-styles = getSampleStyleSheet()
-story = []
-
-# Title
-story.append(Paragraph("Financial Data Report", styles["Title"]))
-story.append(Spacer(1, 20))
-
-# Summary insights
-insight_text = f"""
+
+
+def load_financial(csv_path):
+    """Load the CSV through a parquet cache shared by the finance scripts.
+
+    The cache is rebuilt only when the CSV is newer; parquet stores Date as a
+    native timestamp, so repeat runs skip both tokenization and date parsing.
+    """
+    cache_path = csv_path + ".parquet"
+    if not os.path.exists(cache_path) or os.path.getmtime(cache_path) < os.path.getmtime(csv_path):
+        # Arrow's CSV reader tokenizes in parallel with SIMD and parses the
+        # dates inline, unlike pandas' single-threaded C parser
+        pd.read_csv(csv_path, engine="pyarrow", parse_dates=["Date"]).to_parquet(cache_path, engine="pyarrow")
+    # Arrow-backed columns are contiguous value-only buffers (no NumPy block
+    # consolidation), roughly halving resident memory; reductions dispatch to
+    # Arrow compute kernels and to_numpy() materializes only at plot time
+    return pd.read_parquet(cache_path, dtype_backend="pyarrow")
+
+
+# One fused pass over Close: mean, min, max, and the returns each previously
+# traversed the column separately, costing 4x the memory bandwidth.
+# cache=True keeps the compiled kernel across runs.
+@numba.njit(cache=True, fastmath=True)
+def summarize(close):
+    n = close.shape[0]
+    returns = np.empty(n, dtype=np.float64)
+    returns[0] = np.nan
+    total = close[0]
+    lo = close[0]
+    hi = close[0]
+    for i in range(1, n):
+        c = close[i]
+        total += c
+        if c < lo:
+            lo = c
+        if c > hi:
+            hi = c
+        returns[i] = (c / close[i - 1] - 1.0) * 100.0
+    return total / n, lo, hi, returns
+
+
+def render_charts(df):
+    """Render the three report charts concurrently, each into an in-memory
+    PNG stream -- no temp-file round trip between matplotlib and ReportLab."""
+    import matplotlib
+    # Pure in-process rasterizer: never let a GUI backend (Tk/macOS)
+    # initialize for a batch script that only ever calls savefig
+    matplotlib.use("Agg")
+    from matplotlib.figure import Figure
+
+    # Each render builds its own Figure object rather than going through
+    # pyplot, so there is no shared figure-manager state and the three charts
+    # can rasterize and PNG-encode concurrently.
+
+    def save_png(fig):
+        buf = BytesIO()
+        fig.savefig(buf, format="png", dpi=100)
+        buf.seek(0)
+        return buf
+
+    def render_prices():
+        fig = Figure(figsize=(10, 4))
+        ax = fig.subplots()
+        for col in ["Open", "High", "Low", "Close"]:
+            ax.plot(df["Date"], df[col], label=col)
+        ax.set_title("Stock Prices Over Time")
+        ax.legend()
+        return save_png(fig)
+
+    def render_volume():
+        fig = Figure(figsize=(10, 4))
+        ax = fig.subplots()
+        ax.bar(df["Date"], df["Volume"])
+        ax.set_title("Trading Volume Over Time")
+        return save_png(fig)
+
+    def render_returns():
+        fig = Figure(figsize=(10, 4))
+        ax = fig.subplots()
+        ax.plot(df["Date"], df["Daily Return (%)"])
+        ax.set_title("Daily Percentage Returns")
+        return save_png(fig)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        return tuple(executor.map(
+            lambda render: render(),
+            [render_prices, render_volume, render_returns],
+        ))
+
+
+def build_pdf(stats, chart_streams, pdf_path="financial_report.pdf"):
+    """Assemble the PDF report from the summary stats and chart images."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Image as ReportLabImage, Paragraph, SimpleDocTemplate, Spacer
+
+    price_png, volume_png, returns_png = chart_streams
+
+    doc = SimpleDocTemplate(pdf_path, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    # Title
+    story.append(Paragraph("Financial Data Report", styles["Title"]))
+    story.append(Spacer(1, 20))
+
+    # Summary insights
+    insight_text = f"""
 This report analyzes financial data over the observed period. Key highlights include:
 
-- Average closing price: ${avg_close:.2f}
-- Highest closing price: ${max_close:.2f}
-- Lowest closing price: ${min_close:.2f}
-- Average trading volume: {avg_volume:,.0f} shares
+- Average closing price: ${stats['avg_close']:.2f}
+- Highest closing price: ${stats['max_close']:.2f}
+- Lowest closing price: ${stats['min_close']:.2f}
+- Average trading volume: {stats['avg_volume']:,.0f} shares
 """
-story.append(Paragraph(insight_text, styles["Normal"]))
-story.append(Spacer(1, 20))
-
-# Charts
-for chart_path, title in [
-    (price_path, "Stock Prices Over Time"),
-    (volume_path, "Trading Volume Over Time"),
-    (returns_path, "Daily Percentage Returns")
-]:
-    story.append(Paragraph(title, styles["Heading2"]))
-    story.append(Spacer(1, 10))
-    story.append(ReportLabImage(chart_path, width=500, height=250))
+    story.append(Paragraph(insight_text, styles["Normal"]))
     story.append(Spacer(1, 20))
 
-# Build PDF
-doc.build(story)
-print(f"PDF report created at: {pdf_path}")
+    # Charts: extend the story with one flat comprehension instead of four
+    # append dispatches per chart
+    charts = [
+        (price_png, "Stock Prices Over Time"),
+        (volume_png, "Trading Volume Over Time"),
+        (returns_png, "Daily Percentage Returns")
+    ]
+    story += [
+        item
+        for chart_png, title in charts
+        for item in (
+            Paragraph(title, styles["Heading2"]),
+            Spacer(1, 10),
+            ReportLabImage(chart_png, width=500, height=250),
+            Spacer(1, 20),
+        )
+    ]
+
+    # Build PDF
+    doc.build(story)
+    print(f"PDF report created at: {pdf_path}")
+
+
+def main():
+    df = load_financial(CSV_PATH)
+
+    # Calculate extra metrics
+    close_arr = df["Close"].to_numpy(copy=False)
+    avg_close, min_close, max_close, returns = summarize(close_arr)
+    df["Daily Return (%)"] = returns
+
+    stats = {
+        "avg_close": avg_close,
+        "min_close": min_close,
+        "max_close": max_close,
+        "avg_volume": df["Volume"].to_numpy(copy=False).mean(),
+    }
+
+    # Create plots in memory
+    chart_streams = render_charts(df)
+
+    # Generate PDF report
+    build_pdf(stats, chart_streams)
+
+
+if __name__ == "__main__":
+    main()
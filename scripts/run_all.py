@@ -0,0 +1,45 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pandas", "numpy", "numba", "pyarrow", "matplotlib", "reportlab", "Pillow", "python-pptx"]
+# ///
+"""
+Batch driver: build the PDF and PowerPoint reports in parallel.
+
+Both pipelines are CPU-bound in their chart rasterizers and image/font
+encoders, so each runs in its own process via multiprocessing.Pool. The
+shared CSV parse happens once up front: the driver warms the parquet cache
+before forking, so the PDF worker loads typed columnar data and the pptx
+worker only reads the header plus one CSV row.
+
+Usage:
+    uv run run_all.py
+"""
+
+import multiprocessing
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import report_finances
+import table_to_powerpoint
+
+
+def run_job(job):
+    job()
+
+
+def main():
+    # Warm the shared parquet cache once so the workers don't both pay (or
+    # race on) the CSV parse
+    report_finances.load_financial(report_finances.CSV_PATH)
+
+    with multiprocessing.Pool(2) as pool:
+        pool.map(run_job, [report_finances.main, table_to_powerpoint.main])
+
+    print("All reports generated.")
+
+
+if __name__ == "__main__":
+    main()
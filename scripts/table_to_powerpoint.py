@@ -1,11 +1,14 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.11"
-# dependencies = ["pandas", "matplotlib", "python-pptx"]
+# dependencies = ["numpy", "Pillow", "python-pptx"]
 # ///
 
-import pandas as pd
-import matplotlib.pyplot as plt
+import csv
+from datetime import date
+
+import numpy as np
+from PIL import Image, ImageDraw
 from pptx import Presentation
 from pptx.util import Inches
 from io import BytesIO
@@ -13,73 +16,118 @@ from io import BytesIO
 # Path to CSV file
 csv_path = "/Users/greatmaster/Desktop/projects/content_creation/intro-to-vibe-scripting/assets/financial-data.csv"
 
-# Load data into a DataFrame
-df = pd.read_csv(csv_path)
-df["Date"] = pd.to_datetime(df["Date"])
-
-# Use the first row for analysis
-row = df.iloc[0]
-insights = {
-    "Date": row["Date"].date(),
-    "Opening Price": row["Open"],
-    "Closing Price": row["Close"],
-    "Daily High": row["High"],
-    "Daily Low": row["Low"],
-    "Volume Traded": int(row["Volume"]),
-    "Daily Range": row["High"] - row["Low"],
-    "Price Change": row["Close"] - row["Open"]
-}
-
-# Create a bar chart
-plt.figure(figsize=(6, 4))
-plt.bar(["Open", "High", "Low", "Close"],
-        [insights["Opening Price"], insights["Daily High"], insights["Daily Low"], insights["Closing Price"]],
-        color=["blue", "green", "red", "purple"])
-plt.title("Stock Prices on {}".format(insights["Date"]))
-plt.ylabel("Price ($)")
-
-# Save chart to BytesIO
-img_stream = BytesIO()
-plt.savefig(img_stream, format='png')
-img_stream.seek(0)
-
-# Create PowerPoint
-prs = Presentation()
-slide_layout = prs.slide_layouts[5]
-
-# Slide 1 - Title
-slide = prs.slides.add_slide(prs.slide_layouts[0])
-title, subtitle = slide.shapes.title, slide.placeholders[1]
-title.text = "Daily Stock Report"
-subtitle.text = f"Insights for {insights['Date']}"
-
-# Slide 2 - Insights
-slide = prs.slides.add_slide(slide_layout)
-shapes = slide.shapes
-shapes.title.text = "Key Insights"
-
-insight_text = "\n".join([
-    f"Opening Price: ${insights['Opening Price']:.2f}",
-    f"Closing Price: ${insights['Closing Price']:.2f}",
-    f"Daily High: ${insights['Daily High']:.2f}",
-    f"Daily Low: ${insights['Daily Low']:.2f}",
-    f"Volume Traded: {insights['Volume Traded']:,}",
-    f"Daily Range: ${insights['Daily Range']:.2f}",
-    f"Price Change: ${insights['Price Change']:.2f}"
-])
-text_box = shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(4))
-text_frame = text_box.text_frame
-text_frame.text = insight_text
-
-# Slide 3 - Chart
-slide = prs.slides.add_slide(slide_layout)
-shapes = slide.shapes
-shapes.title.text = "Stock Price Chart"
-
-pic = slide.shapes.add_picture(img_stream, Inches(1), Inches(1.5), width=Inches(6))
-
-# Save the presentation
-prs.save("stock_report.pptx")
-
-print("Presentation saved as 'stock_report.pptx'")
-    
\ No newline at end of file
+# The default template is read out of python-pptx's package zip on every
+# Presentation() call; cache its serialized bytes so repeat builds in a warm
+# process (e.g. a batch driver) skip that read. lxml-backed objects can't be
+# pickled or deepcopied, hence a bytes cache.
+_template_bytes = None
+
+
+def blank_presentation():
+    global _template_bytes
+    if _template_bytes is None:
+        buf = BytesIO()
+        Presentation().save(buf)
+        _template_bytes = buf.getvalue()
+    return Presentation(BytesIO(_template_bytes))
+
+
+def main():
+    # Only the first data row is ever used, so skip pandas entirely: stdlib
+    # csv reads the header plus one row in microseconds with no DataFrame
+    # machinery
+    with open(csv_path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        row = dict(zip(header, next(reader)))
+
+    open_price = float(row["Open"])
+    close_price = float(row["Close"])
+    high = float(row["High"])
+    low = float(row["Low"])
+
+    insights = {
+        "Date": date.fromisoformat(row["Date"][:10]),
+        "Opening Price": open_price,
+        "Closing Price": close_price,
+        "Daily High": high,
+        "Daily Low": low,
+        "Volume Traded": int(float(row["Volume"])),
+        "Daily Range": high - low,
+        "Price Change": close_price - open_price
+    }
+
+    # Create a bar chart with Pillow directly -- four rectangles and a handful
+    # of labels don't need matplotlib's figure/axes/font-cache startup
+    CHART_W, CHART_H = 600, 400
+    MARGIN = 40
+
+    labels = ["Open", "High", "Low", "Close"]
+    # One contiguous float64 buffer for the bar values; the geometry below
+    # comes out of a single vectorized expression, and the same code batches
+    # to an (n_days, 4) array if the script ever renders more than one day
+    values = np.array([open_price, high, low, close_price])
+    colors = ["blue", "green", "red", "purple"]
+
+    chart = Image.new("RGB", (CHART_W, CHART_H), "white")
+    draw = ImageDraw.Draw(chart)
+    draw.text((MARGIN, 10), "Stock Prices on {} ($)".format(insights["Date"]), fill="black")
+
+    # Scale bars into the plot area with a little headroom above the tallest
+    plot_h = CHART_H - 2 * MARGIN
+    bar_w = 80
+    gap = (CHART_W - 2 * MARGIN - len(values) * bar_w) // (len(values) - 1)
+    bar_heights = (plot_h * values / (values.max() * 1.1)).astype(np.int64)
+    for i, (label, bar_h, color) in enumerate(zip(labels, bar_heights, colors)):
+        x0 = MARGIN + i * (bar_w + gap)
+        draw.rectangle([x0, CHART_H - MARGIN - int(bar_h), x0 + bar_w, CHART_H - MARGIN], fill=color)
+        draw.text((x0 + bar_w // 3, CHART_H - MARGIN + 8), label, fill="black")
+
+    # Save chart to BytesIO
+    img_stream = BytesIO()
+    chart.save(img_stream, format="PNG")
+    img_stream.seek(0)
+
+    # Create PowerPoint
+    prs = blank_presentation()
+    slide_layout = prs.slide_layouts[5]
+
+    # Slide 1 - Title
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    title, subtitle = slide.shapes.title, slide.placeholders[1]
+    title.text = "Daily Stock Report"
+    subtitle.text = f"Insights for {insights['Date']}"
+
+    # Slide 2 - Insights
+    slide = prs.slides.add_slide(slide_layout)
+    shapes = slide.shapes
+    shapes.title.text = "Key Insights"
+
+    insight_text = "\n".join([
+        f"Opening Price: ${insights['Opening Price']:.2f}",
+        f"Closing Price: ${insights['Closing Price']:.2f}",
+        f"Daily High: ${insights['Daily High']:.2f}",
+        f"Daily Low: ${insights['Daily Low']:.2f}",
+        f"Volume Traded: {insights['Volume Traded']:,}",
+        f"Daily Range: ${insights['Daily Range']:.2f}",
+        f"Price Change: ${insights['Price Change']:.2f}"
+    ])
+    text_box = shapes.add_textbox(Inches(1), Inches(1.5), Inches(8), Inches(4))
+    text_frame = text_box.text_frame
+    text_frame.text = insight_text
+
+    # Slide 3 - Chart
+    slide = prs.slides.add_slide(slide_layout)
+    shapes = slide.shapes
+    shapes.title.text = "Stock Price Chart"
+
+    pic = slide.shapes.add_picture(img_stream, Inches(1), Inches(1.5), width=Inches(6))
+
+    # Save the presentation
+    prs.save("stock_report.pptx")
+
+    print("Presentation saved as 'stock_report.pptx'")
+
+
+if __name__ == "__main__":
+    main()